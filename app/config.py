@@ -1,3 +1,4 @@
+import math
 import os
 from pydantic_settings import BaseSettings
 
@@ -11,8 +12,21 @@ class Settings(BaseSettings):
     database_url: str = ""
     app_name: str = "HRMS Lite"
     debug: bool = True
+    log_level: str = "info"
     host: str = "localhost"
     port: int = 3001
+    workers: int = 0
+    max_workers: int = 8
+    worker_timeout: int = 60
+    graceful_timeout: int = 30
+    keepalive: int = 5
+    max_requests: int = 1000
+    max_requests_jitter: int = 100
+    preload_app: bool = True
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 4
 
     class Config:
         env_file = ".env"
@@ -22,5 +36,26 @@ class Settings(BaseSettings):
             return self.database_url
         return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    def get_workers(self):
+        if self.workers > 0:
+            return self.workers
+        return max(1, min(_usable_cpus(), self.max_workers))
+
+
+def _usable_cpus():
+    """CPUs this process may use, honouring affinity and the cgroup v2 quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
 
 settings = Settings()
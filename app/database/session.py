@@ -64,8 +64,17 @@ def _ensure_db_ready(max_attempts: int = 3, delay_seconds: int = 2) -> None:
             time.sleep(delay_seconds * attempt)
 
 
+# Under gunicorn the master calls init_db() in on_starting before forking, so
+# workers start with this already set and skip the probe and create_all.
+_db_initialized = False
+
+
 def init_db():
-    """Initialize database tables"""
+    """Initialize database tables, at most once per process tree"""
+    global _db_initialized
+    if _db_initialized:
+        return
+    _db_initialized = True
     try:
         _ensure_db_ready()
         Base.metadata.create_all(bind=engine)
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database.session import init_db
+from app.middleware.compression import CompressionMiddleware
 from app.routes import employees, attendance
 
 # Create FastAPI app
@@ -29,6 +30,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (employee/attendance lists)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.gzip_level,
+        brotli_quality=settings.brotli_quality,
+    )
+
 # Include routers
 app.include_router(employees.router, prefix="/api")
 app.include_router(attendance.router, prefix="/api")
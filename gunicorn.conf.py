@@ -0,0 +1,38 @@
+# Gunicorn configuration for production, driven by app.config.Settings.
+# Gunicorn picks this file up automatically: `gunicorn app.main:app`
+from app.config import settings
+
+bind = f"{settings.host}:{settings.port}"
+workers = settings.get_workers()
+worker_class = "app.workers.ProductionUvicornWorker"
+
+# Import the app once in the master so workers fork with it already loaded
+preload_app = settings.preload_app
+
+timeout = settings.worker_timeout
+graceful_timeout = settings.graceful_timeout
+keepalive = settings.keepalive
+
+# Recycle workers periodically to bound memory growth
+max_requests = settings.max_requests
+max_requests_jitter = settings.max_requests_jitter
+
+accesslog = "-"
+errorlog = "-"
+loglevel = settings.log_level
+
+
+def on_starting(server):
+    # Probe the database and create tables once in the master instead of in
+    # every worker (and again on every max_requests recycle).
+    from app.database.session import init_db
+
+    init_db()
+
+
+def post_fork(server, worker):
+    # The engine uses NullPool today, so nothing is inherited from the master;
+    # this keeps workers from sharing sockets if a pooled engine is ever used.
+    from app.database.session import engine
+
+    engine.dispose(close=False)
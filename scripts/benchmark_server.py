@@ -0,0 +1,162 @@
+"""Compare the single-process uvicorn default against the gunicorn production setup.
+
+Usage:
+    python scripts/benchmark_server.py --path /api/employees --requests 2000 --concurrency 50
+
+Each mode is started as a subprocess on its own port, warmed up, then hit with
+concurrent keep-alive GET requests from several client processes, so the load
+generator is not held to one core by the GIL. The client shares the machine
+with the server; for absolute numbers run a dedicated tool such as wrk or oha
+from another host. Throughput, latency percentiles, the average bytes
+on the wire and the number of failed requests are printed for each mode. The
+baseline row runs without compression, matching the original setup.
+"""
+import argparse
+import http.client
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST = "127.0.0.1"
+
+
+def uvicorn_command(port):
+    return [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", HOST, "--port", str(port),
+    ]
+
+
+def gunicorn_command(port):
+    return [
+        sys.executable, "-m", "gunicorn", "app.main:app",
+        "-c", "gunicorn.conf.py", "--bind", f"{HOST}:{port}",
+    ]
+
+
+# (command, extra environment) per mode; the first row is the pre-existing
+# single-process setup, so compression and worker effects show up separately.
+MODES = {
+    "uvicorn (baseline)": (uvicorn_command, {"COMPRESSION_ENABLED": "False"}),
+    "uvicorn + compression": (uvicorn_command, {"COMPRESSION_ENABLED": "True"}),
+    "gunicorn + compression": (gunicorn_command, {"COMPRESSION_ENABLED": "True"}),
+}
+
+
+def wait_until_ready(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return True
+        except OSError:
+            # Covers refused connections and read timeouts while gunicorn
+            # workers are still booting behind an already-bound socket
+            time.sleep(0.2)
+    return False
+
+
+def client_batch(job):
+    """Send `count` requests from `threads` keep-alive connections in one process.
+
+    Returns a list of (latency, body size, ok) tuples; errors are not raised.
+    """
+    port, path, encoding, count, threads = job
+    local = threading.local()
+
+    def fetch(_):
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection(HOST, port, timeout=30)
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": encoding})
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            local.conn = None
+            return time.perf_counter() - start, 0, False
+        return time.perf_counter() - start, len(body), 200 <= response.status < 300
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(fetch, range(count)))
+
+
+def run_load(pool, port, path, total, concurrency, encoding, processes):
+    # Spread the client over several processes so the GIL of a single load
+    # generator does not cap throughput before a multi-worker server does.
+    threads = max(concurrency // processes, 1)
+    jobs = [
+        (port, path, encoding, total // processes + (i < total % processes), threads)
+        for i in range(processes)
+    ]
+    start = time.perf_counter()
+    results = [r for batch in pool.map(client_batch, jobs) for r in batch]
+    elapsed = time.perf_counter() - start
+    ok = [r for r in results if r[2]]
+    if not ok:
+        return {"errors": total}
+    latencies = sorted(r[0] for r in ok)
+    return {
+        "rps": len(ok) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000,
+        "avg_bytes": statistics.mean(r[1] for r in ok),
+        "errors": total - len(ok),
+    }
+
+
+def benchmark_mode(name, command, extra_env, args, pool):
+    env = dict(os.environ, DEBUG="False", **extra_env)
+    process = subprocess.Popen(
+        command, cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_until_ready(f"http://{HOST}:{args.port}/api/health"):
+            print(f"{name}: server did not start")
+            return None
+        load = (pool, args.port, args.path)
+        run_load(*load, min(args.requests, 200), args.concurrency, args.encoding, args.processes)
+        return run_load(*load, args.requests, args.concurrency, args.encoding, args.processes)
+    finally:
+        process.terminate()
+        process.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default="/api/employees")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--port", type=int, default=3101)
+    parser.add_argument("--encoding", default="br, gzip")
+    parser.add_argument("--processes", type=int, default=min(os.cpu_count() or 1, 4),
+                        help="client processes generating load")
+    args = parser.parse_args()
+
+    print(f"GET {args.path}  requests={args.requests}  concurrency={args.concurrency}  "
+          f"client processes={args.processes}  Accept-Encoding={args.encoding!r}")
+    print(f"{'mode':<26}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'bytes':>10}{'errors':>8}")
+    with multiprocessing.Pool(args.processes) as pool:
+        for name, (build, extra_env) in MODES.items():
+            result = benchmark_mode(name, build(args.port), extra_env, args, pool)
+            if result is None:
+                continue
+            if "rps" not in result:
+                print(f"{name:<26}{'all requests failed':>40}{result['errors']:>8}")
+                continue
+            print(f"{name:<26}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}"
+                  f"{result['p99_ms']:>10.1f}{result['avg_bytes']:>10.0f}{result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()